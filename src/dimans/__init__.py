@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Mapping, Sequence
+import math
+from collections.abc import Sequence
 from fractions import Fraction
 from functools import total_ordering
-from numbers import Real, Number
+from numbers import Real
 from typing import Any, Self
 
-from .base_classes import Unit, Dimensional
+from .base_classes import (
+    Unit,
+    Dimensional,
+    _convert_value,
+    _is_number,
+)
 from .dimension import Dimensions, Dimension
 
 
@@ -20,12 +26,44 @@ __all__ = [
 __version__ = "0.0.12"
 
 
+_interned_derived_units: dict[tuple, DerivedUnit] = {}
+_interned_derived_units_size = 1024
+
+_scalar_types = (int, float, Fraction)
+
+_one_half = Fraction(1, 2)
+
+_factor_types = (Fraction, float)
+
+
+def _simplify_exponent(
+    exponent: int | Fraction | float
+) -> int | Fraction | float:
+    """Return integral Fraction exponents as ints."""
+    if type(exponent) is Fraction and exponent.denominator == 1:
+        return exponent.numerator
+    return exponent
+
+
+def _normalize_power(power: Any) -> int | Fraction | float:
+    """Convert a power to an int, a float or a simplified Fraction."""
+    if isinstance(power, (int, float)):
+        return power
+    if type(power) is not Fraction:
+        power = Fraction(power)
+    return _simplify_exponent(power)
+
+
 @total_ordering
 @dataclasses.dataclass(slots=True, frozen=True, eq=False)
 class Quantity(Dimensional):
     value: Real
     unit: DerivedUnit
 
+    _underlying_value: Real | None = dataclasses.field(
+        init=False, repr=False, default=None
+    )
+
     def __str__(self):
         unit_str = str(self.unit)
         if unit_str[0].isdigit():
@@ -47,32 +85,52 @@ class Quantity(Dimensional):
 
     # region Arithmetic operation handlers
     def __pow__(self, power: int | Fraction | float, modulo=None):
-        if not isinstance(power, float):
-            power = Fraction(power)
-        if isinstance(self.value, int):
-            value = Fraction(self.value)
-        else:
-            value = self.value
+        power = _normalize_power(power)
+        value = self.value
+        if isinstance(value, int):
+            value = Fraction(value)
         return Quantity(value ** power, self.unit ** power)
 
+    def sqrt(self) -> Quantity:
+        value = self.value
+        if type(value) in (int, float) and value >= 0:
+            return Quantity(math.sqrt(value), self.unit.sqrt())
+        return self ** _one_half
+
     def __mul__(self, other: Any, /):
+        handler = _quantity_mul_handlers.get(type(other))
+        if handler is not None:
+            return handler(self, other)
         if isinstance(other, Quantity):
-            new_unit: DerivedUnit = self.unit * other.unit
-            if not new_unit.dimensions():
-                return self.value * other.value * new_unit.si_factor()
-            return Quantity(self.value * other.value, new_unit)
+            return self._mul_quantity(other)
         if isinstance(other, Unit):
-            return self * other.as_quantity()
+            return self._mul_unit(other)
         if isinstance(other, Real):
-            return Quantity(self.value * other, self.unit)
+            return self._mul_real(other)
         return NotImplemented
 
+    def _mul_quantity(self, other: Quantity, /):
+        new_unit: DerivedUnit = self.unit * other.unit
+        if not new_unit.dimensions():
+            return self.value * other.value * new_unit.si_factor()
+        return Quantity(self.value * other.value, new_unit)
+
+    def _mul_unit(self, other: Unit, /):
+        return self._mul_quantity(other.as_quantity())
+
+    def _mul_real(self, other: Real, /) -> Quantity:
+        return Quantity(self.value * other, self.unit)
+
     __rmul__ = __mul__
 
     def __add__(self, other: Any, /):
         if isinstance(other, Quantity):
             if self.unit != other.unit:
-                return self + other.convert_to(self.unit)
+                factor, offset = other.unit.conversion_parameters_to(self.unit)
+                return Quantity(
+                    self.value + _convert_value(other.value, factor, offset),
+                    self.unit
+                )
             return Quantity(self.value + other.value, self.unit)
         if other == 0:  # This allows using sum() on a list of quantities.
             return self
@@ -82,7 +140,13 @@ class Quantity(Dimensional):
 
     def __sub__(self, other: Any, /):
         if isinstance(other, Quantity):
-            return self + other.additive_inverse()
+            if self.unit != other.unit:
+                factor, offset = other.unit.conversion_parameters_to(self.unit)
+                return Quantity(
+                    self.value + _convert_value(-other.value, factor, offset),
+                    self.unit
+                )
+            return Quantity(self.value - other.value, self.unit)
         return NotImplemented
 
     def __rsub__(self, other: Any, /):
@@ -98,15 +162,32 @@ class Quantity(Dimensional):
         return Quantity(self.value.__floor__(), self.unit)
 
     def __truediv__(self, other: Any, /):
+        handler = _quantity_truediv_handlers.get(type(other))
+        if handler is not None:
+            return handler(self, other)
         if isinstance(other, Quantity):
-            return self * other.multiplicative_inverse()
+            return self._div_quantity(other)
         if isinstance(other, Unit):
-            return self / other.as_quantity()
+            return self._div_unit(other)
         if isinstance(other, Real):
-            return Quantity(self.value / other, self.unit)
+            return self._div_real(other)
         return NotImplemented
 
+    def _div_quantity(self, other: Quantity, /):
+        return self._mul_quantity(other.multiplicative_inverse())
+
+    def _div_unit(self, other: Unit, /):
+        return self._div_quantity(other.as_quantity())
+
+    def _div_real(self, other: Real, /) -> Quantity:
+        return Quantity(self.value / other, self.unit)
+
     def __rtruediv__(self, other: Any, /):
+        if type(other) in _scalar_types:
+            return Quantity(
+                other / self.value,
+                self.unit.multiplicative_inverse()
+            )
         if isinstance(other, Quantity):
             return self.multiplicative_inverse() * other
         if isinstance(other, Unit):
@@ -121,7 +202,11 @@ class Quantity(Dimensional):
     def __divmod__(self, other: Any, /):
         if isinstance(other, Quantity):
             if self.unit != other.unit:
-                return divmod(self.convert_to(other.unit), other)
+                factor, offset = self.unit.conversion_parameters_to(other.unit)
+                div_, mod_ = divmod(
+                    _convert_value(self.value, factor, offset), other.value
+                )
+                return div_, Quantity(mod_, other.unit)
             div_, mod_ = divmod(self.value, other.value)
             return div_, Quantity(mod_, self.unit)
         if isinstance(other, Unit):
@@ -129,6 +214,8 @@ class Quantity(Dimensional):
         return NotImplemented
 
     def __floordiv__(self, other: Any, /):
+        if type(other) in _scalar_types:
+            return Quantity(self.value // other, self.unit)
         if isinstance(other, Quantity):
             new_unit = self.unit / other.unit
             if not new_unit.dimensions():
@@ -141,6 +228,11 @@ class Quantity(Dimensional):
         return NotImplemented
 
     def __rfloordiv__(self, other: Any, /):
+        if type(other) in _scalar_types:
+            return Quantity(
+                other // self.value,
+                self.unit.multiplicative_inverse()
+            )
         if isinstance(other, Quantity):
             new_unit = other.unit / self.unit
             if not new_unit.dimensions():
@@ -158,7 +250,11 @@ class Quantity(Dimensional):
     def __mod__(self, other: Any, /):
         if isinstance(other, Quantity):
             if self.unit != other.unit:
-                return self.convert_to(other.unit) % other
+                factor, offset = self.unit.conversion_parameters_to(other.unit)
+                return Quantity(
+                    _convert_value(self.value, factor, offset) % other.value,
+                    other.unit
+                )
             return Quantity(self.value % other.value, self.unit)
         if isinstance(other, Unit):
             return self % other.as_quantity()
@@ -174,6 +270,8 @@ class Quantity(Dimensional):
     # region Comparison handlers
     def __eq__(self, other: Any, /):
         if isinstance(other, Quantity):
+            if self.unit is other.unit:
+                return self.value == other.value
             if self.dimensions() != other.dimensions():
                 return False
             if self.underlying_value() != other.underlying_value():
@@ -183,6 +281,8 @@ class Quantity(Dimensional):
 
     def __gt__(self, other):
         if isinstance(other, Quantity):
+            if self.unit is other.unit:
+                return self.value > other.value
             if self.dimensions() != other.dimensions():
                 raise ValueError(f"units must have the same dimensions")
             return self.underlying_value() > other.underlying_value()
@@ -190,7 +290,13 @@ class Quantity(Dimensional):
     # endregion
 
     def underlying_value(self):
-        return self.value * self.unit.si_factor() + self.unit.si_offset()
+        if self._underlying_value is None:
+            object.__setattr__(
+                self,
+                "_underlying_value",
+                self.value * self.unit.si_factor() + self.unit.si_offset()
+            )
+        return self._underlying_value
 
     def dimensions(self):
         return self.unit.dimensions()
@@ -201,6 +307,16 @@ class Quantity(Dimensional):
     def additive_inverse(self):
         return Quantity(-self.value, self.unit)
 
+    @classmethod
+    def from_array(cls, values, unit: Unit) -> Quantity:
+        """Create a quantity which holds a NumPy array of measurements.
+
+        Such quantities are converted with float conversion parameters.
+        """
+        if not isinstance(unit, DerivedUnit):
+            unit = unit.as_derived_unit()
+        return cls(values, unit)
+
     def convert_to(self, other: Unit | Quantity, /):
         """Convert this quantity to another unit.
 
@@ -208,6 +324,8 @@ class Quantity(Dimensional):
         which is equivalent to this quantity
         but in the other unit.
         """
+        if other is self.unit:
+            return Quantity(self.value, other)
         if isinstance(other, Quantity):
             other = other.as_derived_unit()
         if self.unit.dimensions() != other.dimensions():
@@ -215,7 +333,7 @@ class Quantity(Dimensional):
         factor, offset = self.unit.conversion_parameters_to(other)
         if not isinstance(other, DerivedUnit):
             other = other.as_derived_unit()
-        return Quantity(self.value * factor + offset, other)
+        return Quantity(_convert_value(self.value, factor, offset), other)
 
     def convert_to_terms(
         self,
@@ -268,10 +386,77 @@ class Constant(Quantity):
 class DerivedUnit(Unit):
     """Represents a product of one or more base units."""
     symbol: str | None
-    unit_exponents: Mapping[BaseUnit, Fraction | float]
+    unit_exponents: dict[BaseUnit, int | Fraction | float]
     factor: Fraction = Fraction(1)
     offset: Fraction = Fraction(0)
 
+    _has_offset: bool = dataclasses.field(init=False, repr=False)
+    _has_factor: bool = dataclasses.field(init=False, repr=False)
+    _has_neutral_factor: bool = dataclasses.field(init=False, repr=False)
+    _conversion_parameters_cache: dict = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    # Lazily computed, and kept in the instance dict once they are set.
+    _si_factor = None
+    _dimensions = None
+    _hash = None
+    _inverse = None
+    _quantity = None
+    _square_root = None
+    _multiplicands_str = None
+
+    def __post_init__(self):
+        if type(self.unit_exponents) is not dict:
+            object.__setattr__(
+                self, "unit_exponents", dict(self.unit_exponents)
+            )
+        object.__setattr__(self, "_has_offset", bool(self.offset))
+        object.__setattr__(self, "_has_factor", self.factor != 1)
+        # Fraction(1) leaves Fraction and float factors unchanged.
+        object.__setattr__(
+            self,
+            "_has_neutral_factor",
+            type(self.factor) is Fraction and not self._has_factor
+        )
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", Unit.__hash__(self))
+        return self._hash
+
+    def __reduce__(self):
+        # Units cache other units which refer back to them, so units
+        # are pickled and copied as their fields only, here and in BaseUnit.
+        return (
+            self.__class__,
+            (self.symbol, self.unit_exponents, self.factor, self.offset),
+        )
+
+    @classmethod
+    def _intern(
+        cls,
+        unit_exponents: dict[BaseUnit, int | Fraction | float],
+        factor: Fraction | float,
+    ) -> DerivedUnit:
+        """Get a shared unit without a symbol or offset
+        which has the given exponents and factor.
+        """
+        key = (
+            tuple([
+                (id(base_unit), type(exponent), exponent)
+                for base_unit, exponent in unit_exponents.items()
+            ]),
+            type(factor),
+            factor,
+        )
+        unit = _interned_derived_units.get(key)
+        if unit is None:
+            if len(_interned_derived_units) >= _interned_derived_units_size:
+                _interned_derived_units.clear()
+            unit = cls(None, unit_exponents, factor)
+            _interned_derived_units[key] = unit
+        return unit
 
     @classmethod
     def using(
@@ -291,20 +476,20 @@ class DerivedUnit(Unit):
     def __str__(self):
         if self.symbol:
             return self.symbol
-        if self.factor == 1:
-            if self.offset != 0:
+        if not self._has_factor:
+            if self._has_offset:
                 return f"{self._str_with_multiplicands()} + {self.offset}"
             return self._str_with_multiplicands()
-        if self.offset == 0:
+        if not self._has_offset:
             return f"{self.factor} {self._str_with_multiplicands()}"
         return f"{self.factor} {self._str_with_multiplicands()} + {self.offset}"
 
     def __repr__(self):
-        if self.factor == 1:
+        if not self._has_factor:
             _expr = self._str_with_multiplicands()
         else:
             _expr = f"{self.factor} {self._str_with_multiplicands()}"
-        if self.offset != 0:
+        if self._has_offset:
             _expr += f" + {self.offset}"
 
         if self.symbol:
@@ -313,51 +498,65 @@ class DerivedUnit(Unit):
 
     # region Arithmetic operation handlers
     def __pow__(self, power: int | Fraction | float, modulo=None):
-        if not isinstance(power, float):
-            power = Fraction(power)
-        return DerivedUnit(
-            None,
-            {
-                base_unit: exponent * power
-                for base_unit, exponent in self.unit_exponents.items()
-            },
+        power = _normalize_power(power)
+        if power == 0:
+            return _dimensionless
+        if power == 1 and self.symbol is None and not self._has_offset:
+            return self
+        unit_exponents = {}
+        for base_unit, exponent in self.unit_exponents.items():
+            unit_exponents[base_unit] = _simplify_exponent(exponent * power)
+        if self._has_neutral_factor and type(power) is int:
+            factor = self.factor
+        else:
             # For some reason, my type checker thinks Fraction ** int is float.
-            self.factor ** power  # type: ignore
-        )
+            factor = self.factor ** power  # type: ignore
+        return DerivedUnit._intern(unit_exponents, factor)
+
+    def sqrt(self) -> DerivedUnit:
+        if self._square_root is None:
+            object.__setattr__(self, "_square_root", self ** _one_half)
+        return self._square_root
 
     def __mul__(self, other: Any, /):
+        handler = _derived_unit_mul_handlers.get(type(other))
+        if handler is not None:
+            return handler(self, other)
         if isinstance(other, BaseUnit):
-            other = other.as_derived_unit()
+            return self._mul_base_unit(other)
         if isinstance(other, DerivedUnit):
-            base_units = []
-            for unit in self.unit_exponents.keys():
-                if unit not in base_units:
-                    base_units.append(unit)
-            for unit in other.unit_exponents.keys():
-                if unit not in base_units:
-                    base_units.append(unit)
+            return self._mul_derived_unit(other)
+        if isinstance(other, Real):
+            return self._mul_real(other)
+        return NotImplemented
 
-            return DerivedUnit(
-                None,
-                {
-                    base_unit: exponent
-                    for base_unit, exponent in {
-                        base_unit:
-                            self.unit_exponents.get(base_unit, 0) +
-                            other.unit_exponents.get(base_unit, 0)
-                        for base_unit in base_units
-                    }.items()
-                    if exponent != 0
-                },
-                self.factor * other.factor
+    def _mul_derived_unit(self, other: DerivedUnit, /) -> DerivedUnit:
+        unit_exponents = dict(self.unit_exponents)
+        for base_unit, exponent in other.unit_exponents.items():
+            exponent = _simplify_exponent(
+                exponent + unit_exponents.get(base_unit, 0)
             )
+            if exponent == 0:
+                unit_exponents.pop(base_unit, None)
+            else:
+                unit_exponents[base_unit] = exponent
 
-        if isinstance(other, Real):
-            return Quantity(other, self)
-        return NotImplemented
+        if self._has_neutral_factor and type(other.factor) in _factor_types:
+            factor = other.factor
+        elif other._has_neutral_factor and type(self.factor) in _factor_types:
+            factor = self.factor
+        else:
+            factor = self.factor * other.factor
+        return DerivedUnit._intern(unit_exponents, factor)
+
+    def _mul_base_unit(self, other: BaseUnit, /) -> DerivedUnit:
+        return self._mul_derived_unit(other.as_derived_unit())
+
+    def _mul_real(self, other: Real, /) -> Quantity:
+        return Quantity(other, self)
 
     def __add__(self, other: Any, /):
-        if isinstance(other, Number):
+        if _is_number(other):
             if isinstance(other, int):
                 other = Fraction(other)
 
@@ -371,10 +570,21 @@ class DerivedUnit(Unit):
         return NotImplemented
 
     def __truediv__(self, other: Any, /):
+        handler = _derived_unit_truediv_handlers.get(type(other))
+        if handler is not None:
+            return handler(self, other)
+        if other == 1:
+            return self
+        if isinstance(other, Unit):
+            return self._div_unit(other)
+        return NotImplemented
+
+    def _div_unit(self, other: Unit, /) -> DerivedUnit:
+        return self._mul_derived_unit(other.multiplicative_inverse())
+
+    def _div_real(self, other: Real, /):
         if other == 1:
             return self
-        if isinstance(other, DerivedUnit):
-            return self * other.multiplicative_inverse()
         return NotImplemented
 
     def __rtruediv__(self, other: Any, /):
@@ -384,47 +594,73 @@ class DerivedUnit(Unit):
     # endregion
 
     def _str_with_multiplicands(self):
-        if not self.unit_exponents:
-            return "1"
-        return " ".join([
-            f"{base_unit}^{exponent}" if exponent != 1 else str(base_unit)
-            for base_unit, exponent in self.unit_exponents.items()
-        ])
+        if self._multiplicands_str is None:
+            if not self.unit_exponents:
+                multiplicands_str = "1"
+            else:
+                multiplicands_str = " ".join(
+                    f"{base_unit}^{exponent}"
+                    if exponent != 1 else str(base_unit)
+                    for base_unit, exponent in self.unit_exponents.items()
+                )
+            object.__setattr__(
+                self, "_multiplicands_str", multiplicands_str
+            )
+        return self._multiplicands_str
 
     def dimensions(self):
+        if self._dimensions is None:
+            object.__setattr__(
+                self, "_dimensions", self._compute_dimensions()
+            )
+        return self._dimensions
+
+    def _compute_dimensions(self) -> Dimensions:
         dimensions = {}
         for base_unit, exponent in self.unit_exponents.items():
-            if base_unit.dimension not in dimensions:
-                dimensions[base_unit.dimension] = exponent
+            dimension = base_unit.dimension
+            exponent = _simplify_exponent(
+                exponent + dimensions.get(dimension, 0)
+            )
+            if exponent == 0:
+                dimensions.pop(dimension, None)
             else:
-                dimensions[base_unit.dimension] += exponent
-                if dimensions[base_unit.dimension] == 0:
-                    del dimensions[base_unit.dimension]
-        return Dimensions(dimensions)
+                dimensions[dimension] = exponent
+        return Dimensions._intern(dimensions)
 
     def si_factor(self):
-        factor = self.factor
-        for base_unit, exponent in self.unit_exponents.items():
-            factor *= base_unit.si_factor() ** exponent
-        return factor
+        if self._si_factor is None:
+            object.__setattr__(self, "_si_factor", self._compute_si_factor())
+        return self._si_factor
+
+    def _compute_si_factor(self) -> Fraction | float:
+        return math.prod(
+            (
+                base_unit._si_factor_power(exponent)
+                for base_unit, exponent in self.unit_exponents.items()
+            ),
+            start=self.factor,
+        )
 
     def si_offset(self) -> Fraction | float:
         return self.offset
 
     def as_quantity(self) -> Quantity:
-        return Quantity(1 if not self.offset else 0, self)
+        if self._quantity is None:
+            value = 1 if not self._has_offset else 0
+            object.__setattr__(self, "_quantity", Quantity(value, self))
+        return self._quantity
 
     def multiplicative_inverse(self):
-        if self.offset:
-            raise ValueError("can't invert offset unit")
-        return DerivedUnit(
-            None,
-            {
-                base_unit: -exponent
-                for base_unit, exponent in self.unit_exponents.items()
-            },
-            1 / self.factor
-        )
+        if self._inverse is None:
+            if self._has_offset:
+                raise ValueError("can't invert offset unit")
+            unit_exponents = {}
+            for base_unit, exponent in self.unit_exponents.items():
+                unit_exponents[base_unit] = -exponent
+            inverse = DerivedUnit._intern(unit_exponents, 1 / self.factor)
+            object.__setattr__(self, "_inverse", inverse)
+        return self._inverse
 
     def as_derived_unit(self, symbol: str | None = None) -> DerivedUnit:
         return DerivedUnit(
@@ -435,6 +671,9 @@ class DerivedUnit(Unit):
         )
 
 
+_dimensionless = DerivedUnit._intern({}, Fraction(1))
+
+
 @dataclasses.dataclass(slots=True, frozen=True, eq=False)
 class BaseUnit(Unit):
     """A unit of measurement which only has one dimension of power 1.
@@ -459,6 +698,27 @@ class BaseUnit(Unit):
     """The factor by which the base SI unit of the dimension is multiplied by.
     """
 
+    _si_factor_powers: dict[int, Fraction | float] = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+    _conversion_parameters_cache: dict = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    _dimensions = None
+    _hash = None
+    _derived_unit = None
+    _inverse = None
+    _quantity = None
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", Unit.__hash__(self))
+        return self._hash
+
+    def __reduce__(self):
+        return self.__class__, (self.symbol, self.dimension, self.factor)
+
     def __str__(self):
         return self.symbol
 
@@ -467,31 +727,44 @@ class BaseUnit(Unit):
 
     # region Arithmetic operation handlers
     def __pow__(self, power: int | Fraction | float, modulo=None):
-        if not isinstance(power, float):
-            power = Fraction(power)
-        return DerivedUnit(None, {self: power})
+        power = _normalize_power(power)
+        if power == 0:
+            return _dimensionless
+        if power == 1:
+            return self.as_derived_unit()
+        return DerivedUnit._intern({self: power}, Fraction(1))
 
     def __mul__(self, other: Any, /):
+        handler = _base_unit_mul_handlers.get(type(other))
+        if handler is not None:
+            return handler(self, other)
         if isinstance(other, DerivedUnit):
-            return self.as_derived_unit() * other
-
+            return self._mul_derived_unit(other)
         if isinstance(other, BaseUnit):
-            if self == other:
-                return self ** 2
-            return self.as_derived_unit() * other.as_derived_unit()
-
+            return self._mul_base_unit(other)
         if isinstance(other, Real):
-            return Quantity(other, self.as_derived_unit())
+            return self._mul_real(other)
         return NotImplemented
 
+    def _mul_derived_unit(self, other: DerivedUnit, /) -> DerivedUnit:
+        return self.as_derived_unit()._mul_derived_unit(other)
+
+    def _mul_base_unit(self, other: BaseUnit, /) -> DerivedUnit:
+        if self == other:
+            return self ** 2
+        return self.as_derived_unit()._mul_base_unit(other)
+
+    def _mul_real(self, other: Real, /) -> Quantity:
+        return Quantity(other, self.as_derived_unit())
+
     def __add__(self, other: Any, /):
-        if isinstance(other, Number):
+        if _is_number(other):
             if isinstance(other, int):
                 other = Fraction(other)
 
             return DerivedUnit(
                 symbol=None,
-                unit_exponents={self: Fraction(1)},
+                unit_exponents={self: 1},
                 factor=Fraction(1),
                 offset=other
             )
@@ -499,10 +772,21 @@ class BaseUnit(Unit):
         return NotImplemented
 
     def __truediv__(self, other: Any, /):
+        handler = _base_unit_truediv_handlers.get(type(other))
+        if handler is not None:
+            return handler(self, other)
         if other == 1:
             return self
         if isinstance(other, Unit):
-            return self * other.multiplicative_inverse()
+            return self._div_unit(other)
+        return NotImplemented
+
+    def _div_unit(self, other: Unit, /) -> DerivedUnit:
+        return self.as_derived_unit()._div_unit(other)
+
+    def _div_real(self, other: Real, /):
+        if other == 1:
+            return self
         return NotImplemented
 
     def __rtruediv__(self, other: Any, /):
@@ -512,16 +796,35 @@ class BaseUnit(Unit):
     # endregion
 
     def dimensions(self):
-        return Dimensions({self.dimension: Fraction(1)})
+        if self._dimensions is None:
+            object.__setattr__(
+                self, "_dimensions", Dimensions._intern({self.dimension: 1})
+            )
+        return self._dimensions
 
     def as_derived_unit(self, symbol: str | None = None) -> DerivedUnit:
-        return DerivedUnit(symbol, {self: Fraction(1)})
+        if self._derived_unit is None:
+            object.__setattr__(
+                self,
+                "_derived_unit",
+                DerivedUnit._intern({self: 1}, Fraction(1))
+            )
+        if symbol is None:
+            return self._derived_unit
+        return DerivedUnit(symbol, self._derived_unit.unit_exponents)
 
     def as_quantity(self) -> Quantity:
-        return Quantity(Fraction(1), self.as_derived_unit())
+        if self._quantity is None:
+            quantity = Quantity(Fraction(1), self.as_derived_unit())
+            object.__setattr__(self, "_quantity", quantity)
+        return self._quantity
 
     def multiplicative_inverse(self) -> DerivedUnit:
-        return DerivedUnit(None, {self: Fraction(-1)})
+        if self._inverse is None:
+            object.__setattr__(
+                self, "_inverse", DerivedUnit._intern({self: -1}, Fraction(1))
+            )
+        return self._inverse
 
     @classmethod
     def using(
@@ -539,5 +842,67 @@ class BaseUnit(Unit):
     def si_factor(self) -> Fraction | float:
         return self.factor
 
+    def _si_factor_power(
+        self,
+        exponent: int | Fraction | float
+    ) -> Fraction | float:
+        if type(exponent) is not int:
+            return self.factor ** exponent
+        power = self._si_factor_powers.get(exponent)
+        if power is None:
+            power = self.factor ** exponent
+            self._si_factor_powers[exponent] = power
+        return power
+
     def si_offset(self) -> Fraction | float:
         return Fraction(0)
+
+
+# Looking up the exact type of the other operand is cheaper than a chain of
+# isinstance checks, which remain only for subclasses of these types.
+_derived_unit_mul_handlers = {
+    DerivedUnit: DerivedUnit._mul_derived_unit,
+    BaseUnit: DerivedUnit._mul_base_unit,
+    int: DerivedUnit._mul_real,
+    float: DerivedUnit._mul_real,
+    Fraction: DerivedUnit._mul_real,
+}
+_derived_unit_truediv_handlers = {
+    DerivedUnit: DerivedUnit._div_unit,
+    BaseUnit: DerivedUnit._div_unit,
+    int: DerivedUnit._div_real,
+    float: DerivedUnit._div_real,
+    Fraction: DerivedUnit._div_real,
+}
+_base_unit_mul_handlers = {
+    DerivedUnit: BaseUnit._mul_derived_unit,
+    BaseUnit: BaseUnit._mul_base_unit,
+    int: BaseUnit._mul_real,
+    float: BaseUnit._mul_real,
+    Fraction: BaseUnit._mul_real,
+}
+_base_unit_truediv_handlers = {
+    DerivedUnit: BaseUnit._div_unit,
+    BaseUnit: BaseUnit._div_unit,
+    int: BaseUnit._div_real,
+    float: BaseUnit._div_real,
+    Fraction: BaseUnit._div_real,
+}
+_quantity_mul_handlers = {
+    Quantity: Quantity._mul_quantity,
+    Constant: Quantity._mul_quantity,
+    DerivedUnit: Quantity._mul_unit,
+    BaseUnit: Quantity._mul_unit,
+    int: Quantity._mul_real,
+    float: Quantity._mul_real,
+    Fraction: Quantity._mul_real,
+}
+_quantity_truediv_handlers = {
+    Quantity: Quantity._div_quantity,
+    Constant: Quantity._div_quantity,
+    DerivedUnit: Quantity._div_unit,
+    BaseUnit: Quantity._div_unit,
+    int: Quantity._div_real,
+    float: Quantity._div_real,
+    Fraction: Quantity._div_real,
+}
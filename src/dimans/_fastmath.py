@@ -0,0 +1,26 @@
+"""Kernels for converting arrays of measurements.
+
+They are compiled into NumPy ufuncs if the optional Numba is installed.
+"""
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+__all__ = [
+    "scale_and_offset",
+]
+
+
+def scale_and_offset(values, factor: float, offset: float):
+    """Return ``values * factor + offset`` for an array of values."""
+    return values * factor + offset
+
+
+if numba is not None:
+    # Without fastmath, results are rounded exactly like the fallback.
+    scale_and_offset = numba.vectorize(
+        ["float64(float64, float64, float64)"],
+        cache=True,
+    )(scale_and_offset)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from fractions import Fraction
 from functools import total_ordering
+from numbers import Number, Real
 from typing import Self, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -10,6 +12,40 @@ if TYPE_CHECKING:
     from . import DerivedUnit, Quantity
 
 
+def _is_number(value: Any) -> bool:
+    # isinstance checks against the numbers ABCs are slow.
+    return (
+        isinstance(value, (int, float, Fraction, complex))
+        or isinstance(value, Number)
+    )
+
+
+def _is_array(value: Any) -> bool:
+    return hasattr(value, "__array_ufunc__")
+
+
+def _convert_array(
+    values,
+    factor: Fraction | float,
+    offset: Fraction | float,
+):
+    # A Fraction factor would produce an array of Python objects.
+    if offset == 0:
+        return values * float(factor)
+    from ._fastmath import scale_and_offset
+    return scale_and_offset(values, float(factor), float(offset))
+
+
+def _convert_value(
+    value,
+    factor: Fraction | float,
+    offset: Fraction | float,
+):
+    if _is_array(value):
+        return _convert_array(value, factor, offset)
+    return value * factor + offset
+
+
 class Dimensional(ABC):
     @abstractmethod
     def dimensions(self) -> Dimensions:
@@ -47,6 +83,12 @@ class Dimensional(ABC):
 
 @total_ordering
 class Unit(Dimensional, ABC):
+    _conversion_parameters_cache: dict[
+        int, tuple[Unit, tuple[Fraction | float, Fraction | float]]
+    ]
+
+    _conversion_parameters_cache_size = 64
+
     def conversion_parameters_to(self, other: Unit, /) \
             -> tuple[Fraction | float, Fraction | float]:
         """Get the conversion parameters from this unit to another unit.
@@ -56,6 +98,21 @@ class Unit(Dimensional, ABC):
         and the second element must be added
         to get a measurement in the other unit.
         """
+        cache = getattr(self, "_conversion_parameters_cache", None)
+        if cache is None:
+            return self._compute_conversion_parameters_to(other)
+        entry = cache.get(id(other))
+        if entry is not None and entry[0] is other:
+            return entry[1]
+
+        parameters = self._compute_conversion_parameters_to(other)
+        if len(cache) >= self._conversion_parameters_cache_size:
+            cache.clear()
+        cache[id(other)] = (other, parameters)
+        return parameters
+
+    def _compute_conversion_parameters_to(self, other: Unit, /) \
+            -> tuple[Fraction | float, Fraction | float]:
         if self.dimensions() != other.dimensions():
             raise ValueError(f"units must have the same dimensions")
 
@@ -79,6 +136,34 @@ class Unit(Dimensional, ABC):
         """
         return other.conversion_parameters_to(self)
 
+    def float_conversion_parameters_to(self, other: Unit, /) \
+            -> tuple[float, float]:
+        """Get the conversion parameters from this unit to another unit
+        as floats, computed without Fraction arithmetic.
+        """
+        if self.dimensions() != other.dimensions():
+            raise ValueError(f"units must have the same dimensions")
+
+        from_factor = self.si_factor_float()
+        to_factor = other.si_factor_float()
+        from_offset = float(self.si_offset())
+        to_offset = float(other.si_offset())
+
+        factor = from_factor / to_factor
+        return factor, (from_offset * factor - to_offset)
+
+    def convert_values_to(self, values: Iterable[Real], other: Unit, /):
+        """Convert many measurements in terms of this unit to another unit.
+
+        A list is returned, or an array if the values are a NumPy array.
+        """
+        factor, offset = self.conversion_parameters_to(other)
+        if _is_array(values):
+            return _convert_array(values, factor, offset)
+        if offset == 0:
+            return [value * factor for value in values]
+        return [value * factor + offset for value in values]
+
     @abstractmethod
     def as_derived_unit(self, symbol: str | None = None) -> DerivedUnit:
         pass
@@ -95,12 +180,18 @@ class Unit(Dimensional, ABC):
     def si_offset(self) -> Fraction | float:
         pass
 
+    def si_factor_float(self) -> float:
+        """Get the SI factor of this unit as a float."""
+        return float(self.si_factor())
+
     @abstractmethod
     def multiplicative_inverse(self) -> DerivedUnit:
         pass
 
     # region Comparison handlers
     def __eq__(self, other: Any, /):
+        if self is other:
+            return True
         if not isinstance(other, Unit):
             return NotImplemented
 
@@ -122,8 +213,7 @@ class Unit(Dimensional, ABC):
     # endregion
 
     def __hash__(self):
-        dim = self.dimensions()
-        return hash((self.si_factor(), len(dim), sum(dim.values())))
+        return hash((self.dimensions(), self.si_factor()))
 
     @abstractmethod
     def __add__(self, other) -> Unit:
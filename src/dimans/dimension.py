@@ -1,10 +1,9 @@
 import dataclasses
 from collections.abc import MutableMapping, Mapping
 from fractions import Fraction
-from numbers import Number
 from typing import overload, Self
 
-from .base_classes import Dimensional
+from .base_classes import Dimensional, _is_number
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
@@ -100,8 +99,13 @@ dimensions.register("thermodynamic temperature", "Θ")
 dimensions.register("amount of substance", "N")
 
 
+_interned_dimensions: dict[frozenset, "Dimensions"] = {}
+_interned_dimensions_size = 1024
+
+
 class Dimensions(Mapping[Dimension, Fraction | float], Dimensional):
     _map: dict[Dimension, Fraction | float]
+    _hash: int | None = None
 
     def __init__(self, mapping: Mapping[Dimension, Fraction | float] = None):
         if mapping is not None:
@@ -109,6 +113,32 @@ class Dimensions(Mapping[Dimension, Fraction | float], Dimensional):
         else:
             self._map = {}
 
+    @classmethod
+    def _from_dict(cls, mapping: dict[Dimension, Fraction | float]) -> Self:
+        """Create an instance which takes ownership of the given dict."""
+        instance = cls.__new__(cls)
+        instance._map = mapping
+        return instance
+
+    @classmethod
+    def _intern(cls, mapping: dict[Dimension, Fraction | float]) -> Self:
+        """Get the shared instance which is equal to the given dict.
+
+        Equal exponents of different types print differently,
+        so the types are part of the key.
+        """
+        key = frozenset([
+            (dimension, type(exponent), exponent)
+            for dimension, exponent in mapping.items()
+        ])
+        interned = _interned_dimensions.get(key)
+        if interned is None:
+            if len(_interned_dimensions) >= _interned_dimensions_size:
+                _interned_dimensions.clear()
+            interned = cls._from_dict(mapping)
+            _interned_dimensions[key] = interned
+        return interned
+
     def __str__(self):
         if all(exponent == 0 for exponent in self._map.values()):
             return "1"
@@ -128,7 +158,7 @@ class Dimensions(Mapping[Dimension, Fraction | float], Dimensional):
         return self
 
     def multiplicative_inverse(self) -> Self:
-        return Dimensions({d: -p for d, p in self._map.items()})
+        return Dimensions._from_dict({d: -p for d, p in self._map.items()})
 
     def __getitem__(self, __key):
         return self._map.__getitem__(__key)
@@ -139,10 +169,33 @@ class Dimensions(Mapping[Dimension, Fraction | float], Dimensional):
     def __iter__(self):
         return self._map.__iter__()
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        # Mapping.__eq__ copies both sides into new dicts before comparing.
+        if isinstance(other, Dimensions):
+            if (
+                self._hash is not None
+                and other._hash is not None
+                and self._hash != other._hash
+            ):
+                return False
+            return self._map == other._map
+        return super().__eq__(other)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._map.items()))
+        return self._hash
+
+    def __reduce__(self):
+        # The cached hash differs between processes, so it is not pickled.
+        return self.__class__, (self._map,)
+
     # region Arithmetic operations
     def __mul__(self, other):
         if isinstance(other, Dimensions):
-            return Dimensions(
+            return Dimensions._from_dict(
                 {
                     k: (self.get(k, 0) + other.get(k, 0))
                     for k in set(self.keys()) | set(other.keys())
@@ -158,7 +211,7 @@ class Dimensions(Mapping[Dimension, Fraction | float], Dimensional):
             return self
         if isinstance(other, Dimensions):
             return self * other.multiplicative_inverse()
-        elif isinstance(other, Number):
+        elif _is_number(other):
             return self
         else:
             return NotImplemented
@@ -166,17 +219,16 @@ class Dimensions(Mapping[Dimension, Fraction | float], Dimensional):
     def __rtruediv__(self, other):
         if isinstance(other, Dimensions):
             return other * self.multiplicative_inverse()
-        elif isinstance(other, Number):
+        elif _is_number(other):
             return self.multiplicative_inverse()
         else:
             return NotImplemented
 
     def __pow__(self, power, modulo=None):
-        if isinstance(power, (float, Fraction)):
-            return Dimensions({d: p * power for d, p in self._map.items()})
-        elif isinstance(power, int):
-            power = Fraction(power)
-            return Dimensions({d: p * power for d, p in self._map.items()})
+        if isinstance(power, (int, float, Fraction)):
+            return Dimensions._from_dict(
+                {d: p * power for d, p in self._map.items()}
+            )
         else:
             return NotImplemented
 
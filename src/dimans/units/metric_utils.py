@@ -3,7 +3,7 @@ from collections.abc import Sequence
 from fractions import Fraction
 
 from ..base_classes import Unit
-from .. import BaseUnit
+from .. import BaseUnit, DerivedUnit
 
 __all__ = [
     "MetricPrefix",
@@ -64,7 +64,11 @@ binary_metric_prefixes = [
 def map_to_units(unit: Unit, prefix_list: Sequence[MetricPrefix]) -> list[Unit]:
     if not isinstance(unit, BaseUnit):
         return [
-            (prefix.factor * unit).as_derived_unit(prefix.symbol + unit.symbol)
+            DerivedUnit.using(
+                unit,
+                prefix.symbol + unit.symbol,
+                factor=prefix.factor,
+            )
             for prefix in prefix_list
         ]
     if unit.dimension.name == "data":
@@ -1,9 +1,15 @@
+import copy
+import os
+import pickle
+import subprocess
+import sys
 from fractions import Fraction
 
 import pytest
 
 from dimans import BaseUnit, DerivedUnit, Quantity
-from dimans.dimension import Dimension
+from dimans.base_classes import Unit
+from dimans.dimension import Dimension, Dimensions
 
 
 dim_1 = Dimension("dim_1", "dim_1")
@@ -19,6 +25,40 @@ def test_baseunit_conversion_parameters():
     assert one.conversion_parameters_to(one) == (1, 0)
 
 
+def test_baseunit_float_conversion_parameters():
+    one = BaseUnit("1", dim_1, Fraction(1))
+    three = BaseUnit("3", dim_1, Fraction(3))
+
+    assert three.si_factor_float() == 3.0
+    assert type(three.si_factor_float()) is float
+
+    factor, offset = one.float_conversion_parameters_to(three)
+    assert factor == pytest.approx(1 / 3)
+    assert offset == 0.0
+    assert type(factor) is float
+    assert type(offset) is float
+
+    factor, offset = (one + 6).float_conversion_parameters_to(three)
+    assert factor == pytest.approx(1 / 3)
+    assert offset == pytest.approx(2)
+
+    dim_2 = Dimension("dim_2", "dim_2")
+    with pytest.raises(ValueError):
+        one.float_conversion_parameters_to(BaseUnit("x", dim_2, Fraction(1)))
+
+
+def test_baseunit_convert_values():
+    one = BaseUnit("1", dim_1, Fraction(1))
+    two = BaseUnit("2", dim_1, Fraction(2))
+
+    assert two.convert_values_to([1, 2, Fraction(1, 2)], one) == [2, 4, 1]
+    assert one.convert_values_to([], two) == []
+
+    dim_2 = Dimension("dim_2", "dim_2")
+    with pytest.raises(ValueError):
+        one.convert_values_to([1], BaseUnit("x", dim_2, Fraction(1)))
+
+
 def test_baseunit_order():
     one = BaseUnit("1", dim_1, Fraction(1))
     two = BaseUnit("2", dim_1, Fraction(2))
@@ -49,6 +89,20 @@ def test_baseunit_order():
     assert dim_1 != unrelated_unit
 
 
+def test_baseunit_hash():
+    one = BaseUnit("1", dim_1, Fraction(1))
+    another_one = BaseUnit("another 1", dim_1, Fraction(1))
+
+    assert hash(one) == hash(another_one)
+    assert hash(one) == hash(one.as_derived_unit())
+    assert {one: 1}[another_one] == 1
+
+    # Units with other dimensions should not collide.
+    unrelated = BaseUnit("unrelated", Dimension("dim_2", "dim_2"), Fraction(1))
+    assert hash(one) != hash(unrelated)
+    assert hash(one ** 2) == hash(another_one * one)
+
+
 def test_baseunit_compare_other_dimensions():
     unit_1 = BaseUnit("1", dim_1, Fraction(1))
 
@@ -97,6 +151,11 @@ def test_baseunit_conversion_to_derived_unit():
     assert two_du.si_factor() == two.si_factor()
     assert two_du.si_offset() == two.si_offset()
 
+    assert one.as_derived_unit() is one_du
+    assert one.as_quantity() is one.as_quantity()
+    assert one.as_quantity().unit is one_du
+    assert one.as_quantity().value == 1
+
 
 def test_baseunit_pow():
     two = BaseUnit("2", dim_1, Fraction(2))
@@ -245,3 +304,108 @@ def test_baseunit_repr():
 def test_baseunit_str():
     assert str(BaseUnit("x", dim_1, Fraction(1))) == "x"
     assert str(BaseUnit("x", dim_1, Fraction(2))) == "x"
+
+
+def test_baseunit_pickle_and_copy():
+    one = BaseUnit("1", dim_1, Fraction(1))
+    two = BaseUnit("2", dim_1, Fraction(2))
+
+    # Fill the caches, some of which refer back to the units.
+    one.multiplicative_inverse()
+    one.as_quantity()
+    one.conversion_parameters_to(two)
+    per_two = one / two
+
+    copies = (pickle.loads(pickle.dumps(one)), copy.deepcopy(one))
+    for copied in copies:
+        assert copied == one
+        assert hash(copied) == hash(one)
+        assert copied.symbol == one.symbol
+        assert copied.multiplicative_inverse() == one.multiplicative_inverse()
+
+    copies = (pickle.loads(pickle.dumps(per_two)), copy.deepcopy(per_two))
+    for copied in copies:
+        assert copied == per_two
+        assert hash(copied) == hash(per_two)
+        assert str(copied) == str(per_two)
+
+
+def test_baseunit_pickle_across_hash_seeds(tmp_path):
+    # Hashes of strings, and so of dimensions and units, differ between
+    # processes, so unpickled units must not keep the hash they had.
+    import dimans
+
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.path.dirname(os.path.dirname(dimans.__file__)),
+    )
+    path = tmp_path / "units.pickle"
+    dump = (
+        "import pickle, sys\n"
+        "from dimans.units import kelvin, metre, second\n"
+        "kelvin.multiplicative_inverse()\n"
+        "with open(sys.argv[1], 'wb') as f:\n"
+        "    pickle.dump((kelvin, metre / second, kelvin.dimensions()), f)\n"
+    )
+    load = (
+        "import pickle, sys\n"
+        "from dimans.units import kelvin, metre, second\n"
+        "with open(sys.argv[1], 'rb') as f:\n"
+        "    loaded_kelvin, loaded_speed, loaded_dimensions = pickle.load(f)\n"
+        "assert loaded_kelvin == kelvin\n"
+        "assert hash(loaded_kelvin) == hash(kelvin)\n"
+        "assert {kelvin: 1}.get(loaded_kelvin) == 1\n"
+        "assert loaded_speed == metre / second\n"
+        "assert hash(loaded_speed) == hash(metre / second)\n"
+        "assert loaded_dimensions == kelvin.dimensions()\n"
+        "assert hash(loaded_dimensions) == hash(kelvin.dimensions())\n"
+    )
+    for seed, script in (("1", dump), ("2", load)):
+        subprocess.run(
+            [sys.executable, "-c", script, str(path)],
+            env=dict(env, PYTHONHASHSEED=seed),
+            check=True,
+        )
+
+
+def test_conversion_parameters_without_cache():
+    # Units defined outside of dimans need not have a conversion cache.
+    class DoubleUnit(Unit):
+        def dimensions(self):
+            return Dimensions({dim_1: 1})
+
+        def si_factor(self):
+            return Fraction(2)
+
+        def si_offset(self):
+            return Fraction(0)
+
+        def multiplicative_inverse(self):
+            return NotImplemented
+
+        def as_derived_unit(self, symbol=None):
+            return NotImplemented
+
+        def as_quantity(self):
+            return NotImplemented
+
+        def __add__(self, other):
+            return NotImplemented
+
+        def __mul__(self, other):
+            return NotImplemented
+
+        def __truediv__(self, other):
+            return NotImplemented
+
+        def __rtruediv__(self, other):
+            return NotImplemented
+
+        def __pow__(self, power, modulo=None):
+            return NotImplemented
+
+    one = BaseUnit("1", dim_1, Fraction(1))
+    double = DoubleUnit()
+
+    assert double.conversion_parameters_to(one) == (2, 0)
+    assert one.conversion_parameters_to(double) == (Fraction(1, 2), 0)
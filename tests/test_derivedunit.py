@@ -2,6 +2,7 @@ from fractions import Fraction
 
 import pytest
 
+import dimans
 from dimans import BaseUnit, DerivedUnit, Quantity
 from dimans.dimension import Dimension, Dimensions
 
@@ -174,6 +175,42 @@ def test_derived_unit_repr():
     )
 
 
+def test_derived_unit_conversion_parameters_same_factor():
+    unit = DerivedUnit(
+        symbol=None,
+        unit_exponents={base_dim_1: Fraction(2)},
+        factor=Fraction(3),
+    )
+    same_unit = DerivedUnit(
+        symbol="same_unit",
+        unit_exponents={base_dim_1_alt: Fraction(2)},
+        factor=Fraction(3),
+    )
+    offset_unit = DerivedUnit.using(unit, offset=Fraction(5))
+
+    assert unit.conversion_parameters_to(same_unit) == (1, 0)
+    assert offset_unit.conversion_parameters_to(unit) == (1, 5)
+    assert unit.conversion_parameters_to(offset_unit) == (1, -5)
+
+    with pytest.raises(ValueError):
+        unit.conversion_parameters_to(
+            DerivedUnit(None, {base_dim_2: Fraction(2)}, Fraction(3))
+        )
+
+
+def test_derived_unit_conversion_parameters_cache():
+    unit = DerivedUnit(None, {base_dim_1: Fraction(1)}, Fraction(3))
+    offset_units = [
+        DerivedUnit.using(unit, offset=Fraction(offset))
+        for offset in range(100)
+    ]
+
+    for _ in range(2):
+        for offset, offset_unit in enumerate(offset_units):
+            assert unit.conversion_parameters_to(offset_unit) == (1, -offset)
+            assert offset_unit.conversion_parameters_to(unit) == (1, offset)
+
+
 def test_derived_unit_dimensionless_repr():
     assert (
         repr(
@@ -216,6 +253,28 @@ def test_derived_unit_dimensions():
        )
     ).dimensions() == Dimensions({})
 
+    assert not DerivedUnit(
+        symbol=None,
+        unit_exponents={base_dim_1: Fraction(0)},
+    ).dimensions()
+
+    # Units with the same dimensions share one Dimensions object.
+    assert base_dim_1.dimensions() is base_dim_1_alt.dimensions()
+    assert (base_dim_1 ** 2).dimensions() is (base_dim_1_alt ** 2).dimensions()
+    assert hash(base_dim_1.dimensions()) == hash(Dimensions({dim_1: 1}))
+    assert base_dim_1.dimensions() != base_dim_2.dimensions()
+
+
+def test_derived_unit_dimensions_keep_exponent_types():
+    unit = base_dim_1 * base_dim_2
+    # Equal dimensions with float exponents are built first.
+    float_root = unit ** 0.5
+    root = unit.sqrt()
+
+    assert str(float_root.dimensions()) == "dim_1^0.5 dim_2^0.5"
+    assert str(root.dimensions()) == "dim_1^1/2 dim_2^1/2"
+    assert type((root ** 2).dimensions()[dim_1]) is not float
+
 
 def test_derived_unit_si_parameters():
     x_unit = BaseUnit("x", dim_1, Fraction(7))
@@ -235,6 +294,52 @@ def test_derived_unit_si_parameters():
     assert derived_unit.si_factor() == 11 * 7**2 * 5**3
 
 
+def test_derived_unit_pow():
+    unit = DerivedUnit(
+        symbol=None,
+        unit_exponents={
+            base_dim_1: Fraction(2),
+            base_dim_2: Fraction(-1),
+        },
+        factor=Fraction(3),
+    )
+
+    assert unit ** 1 is unit
+    assert not (unit ** 0).dimensions()
+    assert (unit ** 0).si_factor() == 1
+    assert (base_dim_1 ** 0).unit_exponents == {}
+
+    squared = unit ** 2
+    assert squared.unit_exponents == {base_dim_1: 4, base_dim_2: -2}
+    assert squared.si_factor() == 9
+
+    renamed = unit.as_derived_unit("renamed")
+    assert str(renamed ** 1) == "3 base_dim_1^2 base_dim_2^-1"
+
+
+def test_derived_unit_arithmetic_reuses_units():
+    # The table of reused units is shared by all tests and cleared
+    # when it is full, so this starts from an empty one
+    # and with base units which have not been used yet.
+    dimans._interned_derived_units.clear()
+    unit_1 = BaseUnit("unit_1", dim_1, Fraction(1))
+    unit_1_alt = BaseUnit("unit_1_alt", dim_1, Fraction(1))
+    unit_2 = BaseUnit("unit_2", dim_2, Fraction(1))
+
+    assert unit_1 * unit_2 is unit_1 * unit_2
+    assert unit_1 / unit_2 is unit_1 / unit_2
+    assert unit_1 ** 3 is unit_1 ** 3
+    assert (unit_1 * unit_2) / unit_2 is unit_1 ** 1
+
+    # Equal but distinct base units must not be merged, they print
+    # differently.
+    assert unit_1 * unit_2 is not unit_1_alt * unit_2
+    assert str(unit_1_alt * unit_2) == "unit_1_alt unit_2"
+
+    assert str(base_dim_1 ** 2.0) == "base_dim_1^2.0"
+    assert str(base_dim_1 ** 2) == "base_dim_1^2"
+
+
 def test_derived_unit_multiplicative_inverse():
     x_unit = BaseUnit("x", dim_1, Fraction(7))
     y_unit = BaseUnit("y", dim_2, Fraction(5))
@@ -421,3 +526,29 @@ def test_derived_unit_order():
         offset=Fraction(0),
     )
 
+
+def test_derived_unit_neutral_factor():
+    float_unit = DerivedUnit(None, {base_dim_2: 1}, factor=2.5)
+    int_unit = DerivedUnit(None, {base_dim_2: 1}, factor=3)
+
+    product = base_dim_1.as_derived_unit() * float_unit
+    assert product.factor == 2.5
+    assert type(product.factor) is float
+
+    product = base_dim_1.as_derived_unit() * int_unit
+    assert product.factor == 3
+    assert type(product.factor) is Fraction
+
+    assert type((base_dim_1.as_derived_unit() ** 2).factor) is Fraction
+
+
+def test_derived_unit_conversion_parameters_float_factor():
+    unit = DerivedUnit(None, {base_dim_1: 1}, factor=0.5)
+    same_unit = DerivedUnit("same_unit", {base_dim_1_alt: 1}, factor=0.5)
+
+    # The factor has the same type as it would for any other unit.
+    for other in (unit, same_unit):
+        factor, offset = unit.conversion_parameters_to(other)
+        assert (factor, offset) == (1, 0)
+        assert type(factor) is float
+    assert type(Quantity(5, unit).convert_to(same_unit).value) is float
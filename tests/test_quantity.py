@@ -0,0 +1,166 @@
+from fractions import Fraction
+
+import pytest
+
+from dimans import BaseUnit, DerivedUnit, Quantity
+from dimans.dimension import Dimension
+
+
+dim_1 = Dimension("dim_1", "dim_1")
+dim_2 = Dimension("dim_2", "dim_2")
+
+one = BaseUnit("1", dim_1, Fraction(1)).as_derived_unit()
+two = BaseUnit("2", dim_1, Fraction(2)).as_derived_unit()
+offset_one = DerivedUnit.using(one, offset=Fraction(10))
+unrelated = BaseUnit("unrelated", dim_2, Fraction(1)).as_derived_unit()
+
+
+def test_quantity_compare_same_unit():
+    assert Quantity(3, two) == Quantity(3, two)
+    assert Quantity(3, two) != Quantity(4, two)
+    assert Quantity(4, two) > Quantity(3, two)
+    assert Quantity(3, two) < Quantity(4, two)
+    assert sorted([Quantity(3, two), Quantity(1, two)]) == [
+        Quantity(1, two),
+        Quantity(3, two),
+    ]
+
+
+def test_quantity_compare_other_units():
+    assert Quantity(4, one) == Quantity(2, two)
+    assert Quantity(5, one) > Quantity(2, two)
+    assert Quantity(0, offset_one) == Quantity(10, one)
+
+    assert Quantity(1, one) != Quantity(1, unrelated)
+    with pytest.raises(ValueError):
+        assert Quantity(1, one) > Quantity(1, unrelated)
+
+
+def test_quantity_convert_to():
+    assert Quantity(4, one).convert_to(two) == Quantity(2, two)
+    assert Quantity(4, one).convert_to(two).unit is two
+    assert Quantity(4, one).convert_to(one).unit is one
+    assert Quantity(0, offset_one).convert_to(one).value == 10
+
+    with pytest.raises(ValueError):
+        Quantity(1, one).convert_to(unrelated)
+
+
+def test_quantity_from_array_convert_to():
+    np = pytest.importorskip("numpy")
+
+    quantity = Quantity.from_array(np.array([2.0, 4.0]), two)
+    converted = quantity.convert_to(one)
+    assert converted.unit is one
+    assert converted.value.tolist() == [4.0, 8.0]
+
+    converted = Quantity.from_array(np.array([0.0, 1.0]), offset_one) \
+        .convert_to(one)
+    assert converted.value.tolist() == [10.0, 11.0]
+
+
+def test_quantity_scalar_arithmetic():
+    assert Quantity(3, two) * 2 == Quantity(6, two)
+    assert 2 * Quantity(3, two) == Quantity(6, two)
+    assert (Quantity(3, two) * 2.5).value == 7.5
+    assert Quantity(3, two) / Fraction(2) == Quantity(Fraction(3, 2), two)
+    assert Quantity(7, two) // 2 == Quantity(3, two)
+    assert (6 / Quantity(3, two)).value == 2
+    assert (6 / Quantity(3, two)).unit == two.multiplicative_inverse()
+
+
+def test_quantity_sqrt():
+    square = one * one
+    assert Quantity(9.0, square).sqrt() == Quantity(3.0, one)
+    assert Quantity(9, square).sqrt() == Quantity(3, one)
+    assert Quantity(-4.0, square).sqrt().value == (-4.0) ** 0.5
+    assert Quantity(Fraction(9, 4), square).sqrt().value == 1.5
+
+
+def test_quantity_add_sub_other_units():
+    assert Quantity(1, two) + Quantity(2, one) == Quantity(2, two)
+    assert (Quantity(1, two) + Quantity(2, one)).unit is two
+    assert Quantity(1, two) - Quantity(2, one) == Quantity(0, two)
+    # Units which only differ in their offsets are equal,
+    # so subtracting is the same as adding the additive inverse.
+    a, b = Quantity(1, one), Quantity(0, offset_one)
+    assert a - b == a + (-b)
+    assert a + b == Quantity(1, one)
+    assert Quantity(1, one) + Quantity(2, one ** 1) == Quantity(3, one)
+
+
+def test_quantity_mod_other_units():
+    assert Quantity(5, one) % Quantity(1, two) == Quantity(Fraction(1, 2), two)
+    assert divmod(Quantity(5, one), Quantity(1, two)) == (
+        2,
+        Quantity(Fraction(1, 2), two),
+    )
+
+
+def test_quantity_sub_kelvin_celsius():
+    from dimans.units import celsius, kelvin
+
+    a = kelvin.as_quantity()
+    b = celsius.as_quantity()
+    assert a - b == a + (-b)
+    assert b - a == b + (-a)
+
+
+class FloatArray:
+    """An array of floats, recognized as an array like a NumPy array."""
+
+    __array_ufunc__ = None
+
+    def __init__(self, values):
+        self.values = [float(value) for value in values]
+
+    def __mul__(self, other):
+        assert type(other) is float
+        return FloatArray([value * other for value in self.values])
+
+    def __add__(self, other):
+        if isinstance(other, FloatArray):
+            return FloatArray(
+                [a + b for a, b in zip(self.values, other.values)]
+            )
+        assert type(other) is float
+        return FloatArray([value + other for value in self.values])
+
+    def tolist(self):
+        return list(self.values)
+
+
+def test_scale_and_offset():
+    from dimans import _fastmath
+
+    if _fastmath.numba is not None:
+        pytest.skip("the kernel is a NumPy ufunc when Numba is installed")
+    result = _fastmath.scale_and_offset(FloatArray([0, 1]), 2.0, 10.0)
+    assert result.tolist() == [10.0, 12.0]
+
+    converted = Quantity.from_array(FloatArray([0, 1]), offset_one) \
+        .convert_to(one)
+    assert converted.value.tolist() == [10.0, 11.0]
+
+
+def test_scale_and_offset_numba():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    from dimans._fastmath import scale_and_offset
+
+    values = np.array([0.0, 1.0, 2.5])
+    assert scale_and_offset(values, 2.0, 10.0).tolist() == \
+        (values * 2.0 + 10.0).tolist()
+
+
+def test_quantity_array_convert_to():
+    converted = Quantity.from_array(FloatArray([2, 4]), two).convert_to(one)
+    assert isinstance(converted.value, FloatArray)
+    assert converted.value.tolist() == [4.0, 8.0]
+
+    total = Quantity(FloatArray([1, 2]), one) \
+        + Quantity(FloatArray([1, 2]), two)
+    assert total.value.tolist() == [3.0, 6.0]
+
+    values = two.convert_values_to(FloatArray([1, 2]), one)
+    assert values.tolist() == [2.0, 4.0]